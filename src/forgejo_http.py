@@ -1,6 +1,18 @@
+import random
+import time
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Verbs safe to resend after a connection-level failure: the server may have
+# processed the request before the connection dropped, and replaying a POST
+# would then duplicate the entity (issues, labels, milestones).
+_RETRY_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_ATTEMPTS = 8
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_CAP_SECONDS = 30.0
 
 
 class ForgejoHttp:
@@ -11,8 +23,31 @@ class ForgejoHttp:
             {
                 "Accept": "application/json",
                 "Authorization": f"token {token}",
+                "Connection": "keep-alive",
             }
         )
+        # A migration makes thousands of small Forgejo calls; a tuned pool
+        # keeps connections alive under parallelism. Retries are handled in
+        # _request (full jitter + Retry-After), not at the adapter level, so
+        # the two mechanisms never nest.
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Paths repeat heavily (labels/milestones/issues of the same repo), so
+        # resolved URLs are memoized instead of re-concatenated per call.
+        self._url_cache: dict = {}
+        # ETag cache for conditional GETs: the same lookups (user/org/label
+        # existence checks) are repeated across phases, and a 304 saves the
+        # server re-serializing the body and us re-downloading it. Bounded
+        # like _url_cache - it stores full bodies, and a proxy that tags every
+        # response would otherwise grow it with the run.
+        self._etag_cache: dict = {}
+
+    def __enter__(self) -> "ForgejoHttp":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def close(self):
         try:
@@ -21,35 +56,103 @@ class ForgejoHttp:
             pass
 
     def _url(self, path: str) -> str:
-        if not path.startswith("/"):
-            path = "/" + path
-        return f"{self.api_url}{path}"
-
-    def _merge_headers(self, headers: Optional[dict], sudo: Optional[str]) -> dict:
-        merged = {}
-        if headers:
-            merged.update(headers)
-        if sudo:
-            merged["Sudo"] = sudo
-        return merged
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self.api_url + (path if path.startswith("/") else "/" + path)
+            if len(self._url_cache) < 4096:
+                self._url_cache[path] = url
+        return url
 
-    def get(self, path: str, sudo: Optional[str] = None, **kwargs) -> requests.Response:
+    def _merge_headers(self, headers: Optional[dict], sudo: Optional[str]) -> Optional[dict]:
+        # Most calls pass neither extra headers nor sudo; avoid allocating a
+        # dict on that path (requests treats headers=None as "no extras").
+        if not sudo:
+            return headers
+        if not headers:
+            return {"Sudo": sudo}
+        return {**headers, "Sudo": sudo}
+
+    def _request(self, method: str, path: str, sudo: Optional[str] = None, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", 30)
         headers = self._merge_headers(kwargs.pop("headers", None), sudo)
-        return self.session.get(self._url(path), timeout=kwargs.pop("timeout", 30), headers=headers, **kwargs)
+        url = self._url(path)
+
+        # Exponential backoff with full jitter; a Retry-After header from the
+        # server overrides the computed delay. Timeouts are not retried here -
+        # _import_project_repo has its own, longer-horizon handling for those.
+        # Status-based retries (429/5xx) apply to every verb because the
+        # server refused to act; connection-level failures only retry for
+        # idempotent verbs, since the request may already have been processed.
+        resp: requests.Response
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                resp = self.session.request(method, url, headers=headers, **kwargs)
+            except requests.exceptions.Timeout:
+                raise
+            except requests.exceptions.RequestException:
+                if method.upper() not in _RETRY_SAFE_METHODS or attempt == _RETRY_ATTEMPTS - 1:
+                    raise
+                time.sleep(self._retry_delay(attempt, None))
+                continue
+
+            if resp.status_code not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS - 1:
+                return resp
+            time.sleep(self._retry_delay(attempt, resp.headers.get("Retry-After")))
+        return resp
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        backoff = min(_RETRY_CAP_SECONDS, _RETRY_BASE_SECONDS * 2 ** attempt)
+        return backoff + random.uniform(0, _RETRY_BASE_SECONDS)
+
+    def get(self, path: str, sudo: Optional[str] = None, **kwargs) -> requests.Response:
+        params = kwargs.get("params")
+        cache_key = (
+            self._url(path),
+            tuple(sorted(params.items())) if isinstance(params, dict) else None,
+            sudo,
+        )
+        cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers["If-None-Match"] = cached[0]
+            kwargs["headers"] = headers
+
+        resp = self._request("GET", path, sudo, **kwargs)
+
+        if resp.status_code == 304 and cached is not None:
+            return self._response_from_cache(resp, cached[1])
+
+        etag = resp.headers.get("ETag")
+        if resp.ok and etag and (cache_key in self._etag_cache or len(self._etag_cache) < 4096):
+            self._etag_cache[cache_key] = (etag, resp.content)
+        return resp
+
+    @staticmethod
+    def _response_from_cache(resp: requests.Response, body: bytes) -> requests.Response:
+        synthesized = requests.Response()
+        synthesized.status_code = 200
+        synthesized._content = body
+        synthesized.headers = resp.headers
+        synthesized.url = resp.url
+        synthesized.request = resp.request
+        synthesized.encoding = resp.encoding
+        return synthesized
 
     def post(self, path: str, sudo: Optional[str] = None, **kwargs) -> requests.Response:
-        headers = self._merge_headers(kwargs.pop("headers", None), sudo)
-        return self.session.post(self._url(path), timeout=kwargs.pop("timeout", 30), headers=headers, **kwargs)
+        return self._request("POST", path, sudo, **kwargs)
 
     def put(self, path: str, sudo: Optional[str] = None, **kwargs) -> requests.Response:
-        headers = self._merge_headers(kwargs.pop("headers", None), sudo)
-        return self.session.put(self._url(path), timeout=kwargs.pop("timeout", 30), headers=headers, **kwargs)
+        return self._request("PUT", path, sudo, **kwargs)
 
     def patch(self, path: str, sudo: Optional[str] = None, **kwargs) -> requests.Response:
-        headers = self._merge_headers(kwargs.pop("headers", None), sudo)
-        return self.session.patch(self._url(path), timeout=kwargs.pop("timeout", 30), headers=headers, **kwargs)
+        return self._request("PATCH", path, sudo, **kwargs)
 
     def delete(self, path: str, sudo: Optional[str] = None, **kwargs) -> requests.Response:
-        headers = self._merge_headers(kwargs.pop("headers", None), sudo)
-        return self.session.delete(self._url(path), timeout=kwargs.pop("timeout", 30), headers=headers, **kwargs)
+        return self._request("DELETE", path, sudo, **kwargs)
 
@@ -14,7 +14,6 @@ Options
   --migrate-from-csv=<csv>   only migrate projects listed in CSV (uses only the url column)
 """
 
-import json
 import os
 
 from docopt import docopt
@@ -25,9 +24,11 @@ from pyforgejo import AuthenticatedClient
 from pyforgejo.api.miscellaneous import get_version
 
 from migrate_users import import_users
+from tools import fast_json
 from tools.fg_migration import fg_print
 from forgejo_http import ForgejoHttp
 from migrate_organizations import import_groups
+from tools.user_import import preload_forgejo_users
 import tools.migration_config as cfg
 
 from migrate_projects import import_projects
@@ -47,18 +48,26 @@ def main():
     assert isinstance(gl.user, gitlab.v4.objects.CurrentUser)
     fg_print.info(f"Connected to Gitlab, version: {gl.version()[0]}")
 
-    fg_client = AuthenticatedClient(base_url=cfg.FORGEJO_API_URL, token=cfg.FORGEJO_TOKEN)
-    fg_ver = json.loads(get_version.sync_detailed(client=fg_client).content)["version"]
-    fg_print.info(f"Connected to Forgejo, version: {fg_ver}")
+    # Both clients are context managers, so their connection pools (httpx for
+    # pyforgejo, urllib3 for ForgejoHttp) are torn down promptly on exit.
+    with AuthenticatedClient(
+        base_url=cfg.FORGEJO_API_URL, token=cfg.FORGEJO_TOKEN
+    ) as fg_client, ForgejoHttp(cfg.FORGEJO_API_URL, cfg.FORGEJO_TOKEN) as fg_http:
+        fg_ver = fast_json.loads(get_version.sync_detailed(client=fg_client).content)["version"]
+        fg_print.info(f"Connected to Forgejo, version: {fg_ver}")
 
-    fg_http = ForgejoHttp(cfg.FORGEJO_API_URL, cfg.FORGEJO_TOKEN)
+        # Seed the user cache up front: one paginated listing replaces a GET
+        # per distinct author/assignee/member encountered later.
+        known_users = preload_forgejo_users(fg_http)
+        print(f"Preloaded {known_users} existing Forgejo users")
 
-    try:
         if args["users"] or args["all"]:
             import_users(gl, fg_client, notify=bool(args["notify"]))
         if args["groups"] or args["all"]:
             import_groups(gl, fg_client, fg_http)
-        if args["projects"] or args["all"]:
+        # A CSV implies the projects phase: the reader resolves exactly the
+        # listed projects by path, never enumerating the full GitLab universe.
+        if args["projects"] or args["all"] or args["migrate-from-csv"]:
             import_projects(gl, fg_client, fg_http, csv_path=args.get("migrate-from-csv"))
 
         if (
@@ -66,6 +75,7 @@ def main():
                 and not args["groups"]
                 and not args["projects"]
                 and not args["all"]
+                and not args["migrate-from-csv"]
         ):
             print()
             fg_print.warning("No migration option(s) selected, nothing to do!")
@@ -78,8 +88,6 @@ def main():
             fg_print.error(f"Migration finished with {fg_print.GLOBAL_ERROR_COUNT} errors!")
             print("Failed elements:")
             print(*fg_print.GLOBAL_ERROR_LIST, sep="\n")
-    finally:
-        fg_http.close()
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,5 @@
-import json
-import re
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 import requests
 import gitlab
@@ -10,22 +9,30 @@ from pyforgejo import AuthenticatedClient
 from pyforgejo.api.organization import org_create, org_get, org_list_teams
 from pyforgejo.models.create_org_option import CreateOrgOption
 
+from tools import fast_json
 from tools.fg_migration import fg_print
 from forgejo_http import ForgejoHttp
+from tools.names import name_clean
 from tools.user_import import ensure_user_exists, gitlab_email_for_user_id, gitlab_email_for_username
 
 
-def name_clean(name: str) -> str:
-    new_name = name.replace(" ", "_")
-    new_name = re.sub(r"[^a-zA-Z0-9_\.-]", "-", new_name)
-    if new_name.lower() == "plugins":
-        return f"{new_name}-user"
-    return new_name
+# Existence and team listings per clean org name, kept for the whole run:
+# the same group comes up once per group import and again for every project
+# it owns, and each probe used to cost a fresh round-trip.
+_org_cache: Dict[str, dict] = {}
 
 
 def organization_exists(fg_client: AuthenticatedClient, orgname: str) -> bool:
+    cached = _org_cache.get(orgname)
+    if cached is not None:
+        if cached["exists"]:
+            fg_print.warning(f"Group {orgname} already exists in Forgejo, skipping!")
+        return cached["exists"]
+
     resp: requests.Response = org_get.sync_detailed(orgname, client=fg_client)
-    if resp.status_code.name == "OK":
+    exists = resp.status_code.name == "OK"
+    _org_cache[orgname] = {"exists": exists, "teams": None}
+    if exists:
         fg_print.warning(f"Group {orgname} already exists in Forgejo, skipping!")
         return True
     print(f"Group {orgname} not found in Forgejo, importing!")
@@ -33,30 +40,39 @@ def organization_exists(fg_client: AuthenticatedClient, orgname: str) -> bool:
 
 
 def get_teams(fg_client: AuthenticatedClient, orgname: str) -> List:
+    cached = _org_cache.get(orgname)
+    if cached is not None and cached.get("teams") is not None:
+        return cached["teams"]
+
     resp: requests.Response = org_list_teams.sync_detailed(orgname, client=fg_client)
     if resp.status_code.name == "OK":
-        return json.loads(resp.content)
-    msg = json.loads(resp.content).get("errors")
-    fg_print.error(f"Failed to load existing teams for organization {orgname}! {msg}")
+        teams = fast_json.loads(resp.content)
+        _org_cache.setdefault(orgname, {"exists": True})["teams"] = teams
+        return teams
+    fg_print.error(f"Failed to load existing teams for organization {orgname}! {fast_json.error_message(resp)}")
     return []
 
 
 def get_team_members(fg_http: ForgejoHttp, teamid: int) -> List:
-    resp: requests.Response = fg_http.get(f"/teams/{teamid}/members", timeout=10)
-    if resp.ok:
-        return resp.json()
-    fg_print.error(f"Failed to load existing members for team {teamid}! {resp.text}")
-    return []
-
-
-def member_exists(fg_http: ForgejoHttp, username: str, teamid: int) -> bool:
-    existing_members = get_team_members(fg_http, teamid)
-    existing_member = next((m for m in existing_members if m.get("username") == username), None)
-    if existing_member:
-        fg_print.warning(f"Member {username} is already in team {teamid}, skipping!")
-        return True
-    print(f"Member {username} is not in team {teamid}, importing!")
-    return False
+    # Walk the pages explicitly: the default page size silently truncates
+    # large teams, which would make the membership dedupe re-add members.
+    members: List = []
+    page = 1
+    while True:
+        resp: requests.Response = fg_http.get(
+            f"/teams/{teamid}/members",
+            params={"limit": 50, "page": page},
+            timeout=10,
+        )
+        if not resp.ok:
+            fg_print.error(f"Failed to load existing members for team {teamid}! {resp.text}")
+            break
+        chunk = fast_json.loads(resp.content)
+        members.extend(chunk)
+        if len(chunk) < 50:
+            break
+        page += 1
+    return members
 
 
 def _resolve_gitlab_member_email(gitlab_api: gitlab.Gitlab, member: object) -> Optional[str]:
@@ -95,6 +111,10 @@ def _import_group_members(
     first_team_name = existing_teams[0]["name"]
     print(f"Organization teams fetched, importing users to first team: {first_team_name}")
 
+    # One listing up front instead of one per member: membership is then an
+    # O(1) set probe, and successful PUTs keep the set current.
+    existing_members = {m.get("username") for m in get_team_members(fg_http, team_id)}
+
     for member in members:
         username = (getattr(member, "username", "") or "").strip()
         if not username:
@@ -112,18 +132,56 @@ def _import_group_members(
         if not u_obj:
             continue
 
-        if not member_exists(fg_http, username, team_id):
-            resp: requests.Response = fg_http.put(
-                f"/teams/{team_id}/members/{username}",
-                timeout=10,
+        if username in existing_members:
+            fg_print.warning(f"Member {username} is already in team {team_id}, skipping!")
+            continue
+
+        resp: requests.Response = fg_http.put(
+            f"/teams/{team_id}/members/{username}",
+            timeout=10,
+        )
+        if resp.ok:
+            fg_print.info(f"Member {username} added to group {clean_group_name}!")
+            existing_members.add(username)
+        else:
+            fg_print.error(
+                f"Failed to add member {username} to group {clean_group_name}! {resp.status_code} {resp.text}",
+                f"failed to add member {username} to group {clean_group_name}",
             )
-            if resp.ok:
-                fg_print.info(f"Member {username} added to group {clean_group_name}!")
-            else:
-                fg_print.error(
-                    f"Failed to add member {username} to group {clean_group_name}! {resp.status_code} {resp.text}",
-                    f"failed to add member {username} to group {clean_group_name}",
-                )
+
+
+def _precreate_member_users(
+        gitlab_api: gitlab.Gitlab,
+        fg_client: AuthenticatedClient,
+        members_by_group: Dict[int, List[gitlab.v4.objects.GroupMember]],
+):
+    # Users frequently belong to several groups; create the union of distinct
+    # usernames once, concurrently, so the sequential membership phase below
+    # only issues PUTs against users that are guaranteed to exist.
+    distinct: Dict[str, gitlab.v4.objects.GroupMember] = {}
+    for members in members_by_group.values():
+        for member in members:
+            username = (getattr(member, "username", "") or "").strip()
+            if username:
+                distinct.setdefault(username, member)
+
+    if not distinct:
+        return
+
+    def _ensure_one(item):
+        username, member = item
+        email = _resolve_gitlab_member_email(gitlab_api, member) or f"{username}@noemail-git.local"
+        ensure_user_exists(
+            fg_client,
+            username,
+            full_name=username,
+            email=email,
+            notify=False,
+            reason="needed for org membership import",
+        )
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(_ensure_one, distinct.items()))
 
 
 def _import_groups(
@@ -133,8 +191,12 @@ def _import_groups(
         groups: List[gitlab.v4.objects.Group],
 ):
     print(f"Found {len(groups)} gitlab groups")
+
+    members_by_group = {group.id: group.members.list(all=True) for group in groups}
+    _precreate_member_users(gitlab_api, fg_client, members_by_group)
+
     for group in groups:
-        members: List[gitlab.v4.objects.GroupMember] = group.members.list(all=True)
+        members: List[gitlab.v4.objects.GroupMember] = members_by_group[group.id]
 
         clean_group_name = name_clean(group.name)
         print(f"Importing group {clean_group_name}...")
@@ -153,8 +215,9 @@ def _import_groups(
             )
             if resp.status_code.name == "CREATED":
                 fg_print.info(f"Group {clean_group_name} imported!")
+                _org_cache[clean_group_name] = {"exists": True, "teams": None}
             else:
-                msg = json.loads(resp.content).get("message")
+                msg = fast_json.error_message(resp)
                 fg_print.error(
                     f"Group {clean_group_name} import failed: {msg}",
                     f"failed to import group {clean_group_name}",
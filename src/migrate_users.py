@@ -1,4 +1,6 @@
-from typing import List
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
 import gitlab
 from pyforgejo import AuthenticatedClient
@@ -7,24 +9,37 @@ from pyforgejo import AuthenticatedClient
 def _import_users(
         gitlab_api: gitlab.Gitlab,
         fg_client: AuthenticatedClient,
-        users: List[gitlab.v4.objects.User],
+        users: Iterable[gitlab.v4.objects.User],
         notify: bool = False,
 ):
     from tools.user_import import ensure_importer_user, import_one_gitlab_user
     ensure_importer_user(fg_client, notify=False)
-    for u in users:
-        import_one_gitlab_user(gitlab_api, fg_client, u, notify=notify)
+
+    # Per-user imports are independent round-trips (detail fetch, create,
+    # keys); batches of 50 on a small pool overlap them while keeping memory
+    # bounded to one batch of the lazy paginator.
+    count = 0
+    users_iter = iter(users)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while True:
+            batch = list(itertools.islice(users_iter, 50))
+            if not batch:
+                break
+            list(
+                executor.map(
+                    lambda u: import_one_gitlab_user(gitlab_api, fg_client, u, notify=notify),
+                    batch,
+                )
+            )
+            count += len(batch)
+            print(f"Processed {count} users...")
+
+    print(f"Done. Processed {count} users.")
 
 
 def import_users(gitlab_api: gitlab.Gitlab, fg_client: AuthenticatedClient, notify=False):
+    # Lazy paginator: import work starts on the first page and resident memory
+    # stays O(page size) however many users the instance has.
     users_iter = gitlab_api.users.list(iterator=True, per_page=100)
-    count = 0
     print(f"Loading users from GitLab as {gitlab_api.user.username}...")
-
-    for user in users_iter:
-        count += 1
-        if count % 50 == 0:
-            print(f"Fetched {count} users...")
-        _import_users(gitlab_api, fg_client, [user], notify)
-
-    print(f"Done. Processed {count} users.")
+    _import_users(gitlab_api, fg_client, users_iter, notify)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import csv
+import mmap
 import os
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Iterable, List, Optional, Sequence, TypeVar
 
@@ -31,41 +33,85 @@ class InputCsvReader:
         for w in self.validate_hosts(refs):
             warn(w)
 
-        projects: List[T] = []
-        for ref in refs:
+        def _resolve(ref: CsvProjectRef) -> Optional[T]:
             try:
-                projects.append(get_project_by_full_path(ref.full_path))
+                return get_project_by_full_path(ref.full_path)
             except Exception as e:
                 warn(f"Failed to load project for URL {ref.url} (path {ref.full_path}): {e}")
+                return None
 
-        return projects
+        # One GitLab round-trip per row; resolving them on a pool keeps the
+        # total cost near one RTT per 16 rows. executor.map preserves CSV
+        # order, so the import sequence matches the file.
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return [p for p in executor.map(_resolve, refs) if p is not None]
 
     def read_project_urls(self, csv_path: str) -> List[str]:
         self._ensure_csv_exists(csv_path)
 
+        # Single-column files - the common shape - need no quote or dialect
+        # handling: mmap the file and slice lines out of the mapping, decoding
+        # only the URL bytes. Anything else falls back to csv.reader below.
+        with open(csv_path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap refuses empty files; an empty input has no header and
+                # must abort loudly, same as a file with the wrong columns.
+                raise ValueError(f"CSV {csv_path} must contain a header with a 'url' column")
+            with mm:
+                header_end = mm.find(b"\n")
+                header_bytes = bytes(mm[: len(mm) if header_end == -1 else header_end])
+                headers = self._normalize_headers(
+                    next(csv.reader([header_bytes.decode("utf-8")]), None)
+                )
+                if "url" not in headers:
+                    raise ValueError(f"CSV {csv_path} must contain a header with a 'url' column")
+                if headers == ["url"]:
+                    return self._scan_url_column(mm, header_end)
+
         urls: List[str] = []
         with open(csv_path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            headers = self._normalize_headers(reader.fieldnames)
-            if "url" not in headers:
-                raise ValueError(f"CSV {csv_path} must contain a header with a 'url' column")
+            # csv.reader with a positional index: DictReader allocated a dict
+            # per row just to read the single url column back out of it.
+            reader = csv.reader(f)
+            headers = self._normalize_headers(next(reader, None))
+            url_idx = headers.index("url")
 
             for row in reader:
-                u = (row.get("url") or "").strip()
+                if len(row) <= url_idx:
+                    continue
+                u = row[url_idx].strip()
                 if u:
                     urls.append(u)
 
         return urls
 
+    @staticmethod
+    def _scan_url_column(mm: mmap.mmap, header_end: int) -> List[str]:
+        urls: List[str] = []
+        size = len(mm)
+        pos = size if header_end == -1 else header_end + 1
+        while pos < size:
+            nl = mm.find(b"\n", pos)
+            end = size if nl == -1 else nl
+            u = bytes(mm[pos:end]).strip().decode("utf-8")
+            # A single-column writer may still quote the value.
+            if len(u) >= 2 and u[0] == '"' and u[-1] == '"':
+                u = u[1:-1]
+            if u:
+                urls.append(u)
+            pos = end + 1
+        return urls
+
     def read_projects(self, csv_path: str) -> List[CsvProjectRef]:
-        urls = self.read_project_urls(csv_path)
+        # Single pass over the urls: one split per row serves both the host
+        # and the project path, instead of re-parsing in
+        # extract_gitlab_full_path_from_url after a first traversal.
         out: List[CsvProjectRef] = []
 
-        for u in urls:
-            parsed = urllib.parse.urlparse(u.strip())
-            host = (parsed.netloc or "").lower()
-
-            full_path = self.extract_gitlab_full_path_from_url(u)
+        for u in self.read_project_urls(csv_path):
+            host, full_path = self._split_project_url(u)
             if not full_path:
                 raise ValueError(f"Could not parse GitLab project path from URL: {u}")
 
@@ -73,32 +119,54 @@ class InputCsvReader:
 
         return out
 
+    @staticmethod
+    def _split_project_url(url: str) -> tuple:
+        """Host and project path of a clone/web URL via plain string splits.
+
+        Our rows are straightforward scheme://host/group/project[.git] URLs;
+        a couple of partitions cover those far cheaper than urlparse, which
+        stays as the fallback for anything without an explicit scheme.
+        """
+        if "://" not in url:
+            parsed = urllib.parse.urlparse(url)
+            return (parsed.netloc or "").lower(), InputCsvReader._full_path_from_parsed(parsed)
+
+        rest = url.split("://", 1)[1]
+        host, _, path = rest.partition("/")
+        path = path.split("?", 1)[0].split("#", 1)[0].strip("/")
+        if path.endswith(".git"):
+            path = path[:-4]
+        return host.lower(), path or None
+
     def validate_hosts(self, projects: Sequence[CsvProjectRef]) -> List[str]:
-        warnings: List[str] = []
         if not self._cfg_host:
-            return warnings
+            return []
 
+        # Group by foreign host: one warning per host with its URLs, instead
+        # of repeating the same comparison message for every row.
+        urls_by_host: dict = {}
         for p in projects:
             if p.host and p.host != self._cfg_host:
-                warnings.append(
-                    f"CSV URL host {p.host} differs from configured gitlab_url host {self._cfg_host}: {p.url}"
-                )
-        return warnings
+                urls_by_host.setdefault(p.host, []).append(p.url)
+
+        return [
+            f"CSV URL host {host} differs from configured gitlab_url host {self._cfg_host}: {', '.join(urls)}"
+            for host, urls in urls_by_host.items()
+        ]
 
     def extract_gitlab_full_path_from_url(self, url: str) -> Optional[str]:
         try:
-            parsed = urllib.parse.urlparse(url.strip())
-            if not parsed.path:
-                return None
-
-            p = parsed.path.strip("/")
-            if p.endswith(".git"):
-                p = p[:-4]
-
-            return p or None
+            return self._full_path_from_parsed(urllib.parse.urlparse(url.strip()))
         except Exception:
             return None
 
+    @staticmethod
+    def _full_path_from_parsed(parsed: urllib.parse.ParseResult) -> Optional[str]:
+        p = (parsed.path or "").strip("/")
+        if p.endswith(".git"):
+            p = p[:-4]
+        return p or None
+
     def _ensure_csv_exists(self, csv_path: str) -> None:
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
@@ -0,0 +1,37 @@
+"""JSON decoding for the hot migration paths.
+
+orjson decodes 2-5x faster than stdlib json and accepts raw bytes, so
+response bodies never need an intermediate str. Falls back to stdlib json
+when orjson is not installed.
+
+Note: orjson is deliberately not monkey-patched into requests
+(requests.models.complexjson) because requests calls
+complexjson.dumps(..., allow_nan=False) when serializing json= bodies and
+orjson.dumps does not accept that signature.
+"""
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    import json as _json
+
+
+def loads(data):
+    """Decode JSON from bytes or str."""
+    return _json.loads(data)
+
+
+def error_message(resp) -> str:
+    """Best-effort message from an API error response.
+
+    Accepts requests and pyforgejo responses alike (anything with
+    ``.content``) and tolerates non-JSON bodies, which error responses
+    sometimes are. Only for error branches - success paths should not pay
+    for a parse they do not need.
+    """
+    try:
+        parsed = loads(resp.content)
+        msg = parsed.get("message") or parsed.get("errors") or ""
+    except Exception:
+        msg = (getattr(resp, "text", "") or "")[:200]
+    return msg if isinstance(msg, str) else str(msg)
@@ -1,25 +1,70 @@
-import os
 import configparser
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 
 _MIGRATE_INI_PATH = os.path.join(os.path.dirname(__file__), "../..", ".migrate.ini")
 
-if not os.path.exists(_MIGRATE_INI_PATH):
-    print("Please create .migrate.ini as explained in the README!")
-    os.sys.exit()
 
-config = configparser.RawConfigParser()
-config.read(_MIGRATE_INI_PATH)
+@dataclass(frozen=True)
+class Settings:
+    gitlab_url: str
+    gitlab_token: str
+    gitlab_admin_user: str
+    gitlab_admin_pass: str
+    forgejo_url: str
+    forgejo_token: str
+    forgejo_admin_user: str
+    forgejo_admin_pass: str
+
+    @property
+    def forgejo_api_url(self) -> str:
+        return f"{self.forgejo_url}/api/v1"
+
+
+def load_settings(path: str = _MIGRATE_INI_PATH) -> Settings:
+    if not os.path.exists(path):
+        raise RuntimeError("Please create .migrate.ini as explained in the README!")
+
+    config = configparser.RawConfigParser()
+    config.read(path)
+
+    return Settings(
+        gitlab_url=config.get("migrate", "gitlab_url"),
+        gitlab_token=config.get("migrate", "gitlab_token"),
+        gitlab_admin_user=config.get("migrate", "gitlab_admin_user"),
+        gitlab_admin_pass=config.get("migrate", "gitlab_admin_pass"),
+        forgejo_url=config.get("migrate", "forgejo_url"),
+        forgejo_token=config.get("migrate", "forgejo_token"),
+        forgejo_admin_user=config.get("migrate", "forgejo_admin_user"),
+        forgejo_admin_pass=config.get("migrate", "forgejo_admin_pass"),
+    )
+
+
+@lru_cache(maxsize=1)
+def _settings() -> Settings:
+    return load_settings()
 
-GITLAB_URL = config.get("migrate", "gitlab_url")
-GITLAB_TOKEN = config.get("migrate", "gitlab_token")
-GITLAB_ADMIN_USER = config.get("migrate", "gitlab_admin_user")
-GITLAB_ADMIN_PASS = config.get("migrate", "gitlab_admin_pass")
 
-FORGEJO_URL = config.get("migrate", "forgejo_url")
-FORGEJO_API_URL = f"{FORGEJO_URL}/api/v1"
-FORGEJO_TOKEN = config.get("migrate", "forgejo_token")
+# The historical module-level constants, resolved lazily via PEP 562 so the
+# module stays importable without a .migrate.ini and the INI is parsed once,
+# on first use.
+_ATTRIBUTES = {
+    "GITLAB_URL": lambda s: s.gitlab_url,
+    "GITLAB_TOKEN": lambda s: s.gitlab_token,
+    "GITLAB_ADMIN_USER": lambda s: s.gitlab_admin_user,
+    "GITLAB_ADMIN_PASS": lambda s: s.gitlab_admin_pass,
+    "FORGEJO_URL": lambda s: s.forgejo_url,
+    "FORGEJO_API_URL": lambda s: s.forgejo_api_url,
+    "FORGEJO_TOKEN": lambda s: s.forgejo_token,
+    "FORGEJO_ADMIN_USER": lambda s: s.forgejo_admin_user,
+    "FORGEJO_ADMIN_PASS": lambda s: s.forgejo_admin_pass,
+    "FORGEJO_SUDO_USER": lambda s: s.forgejo_admin_user,
+}
 
-FORGEJO_ADMIN_USER = config.get("migrate", "forgejo_admin_user")
-FORGEJO_ADMIN_PASS = config.get("migrate", "forgejo_admin_pass")
 
-FORGEJO_SUDO_USER = FORGEJO_ADMIN_USER
+def __getattr__(name: str):
+    getter = _ATTRIBUTES.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getter(_settings())
@@ -0,0 +1,112 @@
+"""Persistent record of elements already present in Forgejo.
+
+Long migrations get interrupted; without local state every restart re-pays
+one existence probe per user/repo/issue against the API. The state file
+turns that into a local SQLite lookup. Entries are only ever added after
+Forgejo confirmed the element (2xx), so a stale file can cause skipped
+re-checks at worst, never missed imports of new elements.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional, Set
+
+_DB_PATH = os.path.join(os.path.dirname(__file__), "../..", ".migration_state.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (username TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS repos (owner TEXT, name TEXT, PRIMARY KEY (owner, name));
+CREATE TABLE IF NOT EXISTS issues (owner TEXT, repo TEXT, title TEXT,
+                                   PRIMARY KEY (owner, repo, title));
+CREATE TABLE IF NOT EXISTS project_imports (project_id INTEGER PRIMARY KEY,
+                                            last_import TEXT);
+"""
+
+
+class MigrationState:
+    def __init__(self, path: str = _DB_PATH):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def has_user(self, username: str) -> bool:
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT 1 FROM users WHERE username = ?", (username,)
+            )
+            return cur.fetchone() is not None
+
+    def add_user(self, username: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO users (username) VALUES (?)", (username,)
+            )
+
+    def add_users(self, usernames: Iterable[str]) -> None:
+        # One transaction (and thus one commit/fsync) for the whole batch;
+        # per-row add_user calls would pay a commit each, which dwarfs the
+        # inserts themselves when preloading thousands of users.
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO users (username) VALUES (?)",
+                ((u,) for u in usernames),
+            )
+
+    def has_repo(self, owner: str, name: str) -> bool:
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT 1 FROM repos WHERE owner = ? AND name = ?", (owner, name)
+            )
+            return cur.fetchone() is not None
+
+    def add_repo(self, owner: str, name: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO repos (owner, name) VALUES (?, ?)", (owner, name)
+            )
+
+    def last_project_import(self, project_id: int) -> Optional[str]:
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT last_import FROM project_imports WHERE project_id = ?",
+                (project_id,),
+            )
+            row = cur.fetchone()
+            return row[0] if row else None
+
+    def set_project_import(self, project_id: int, when: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO project_imports (project_id, last_import) VALUES (?, ?)",
+                (project_id, when),
+            )
+
+    def issue_titles(self, owner: str, repo: str) -> Set[str]:
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT title FROM issues WHERE owner = ? AND repo = ?", (owner, repo)
+            )
+            return {row[0] for row in cur.fetchall()}
+
+    def add_issue(self, owner: str, repo: str, title: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO issues (owner, repo, title) VALUES (?, ?, ?)",
+                (owner, repo, title),
+            )
+
+
+_state = None
+
+
+def get_state() -> MigrationState:
+    global _state
+    if _state is None:
+        _state = MigrationState()
+    return _state
@@ -0,0 +1,26 @@
+"""Forgejo-safe name mangling shared by the group and project importers."""
+
+import string
+from functools import lru_cache
+
+
+class _CleanTable(dict):
+    # str.translate consults __missing__ for characters absent from the
+    # table, so every disallowed character (including non-ASCII) becomes a
+    # dash without enumerating the whole range up front.
+    def __missing__(self, _code):
+        return "-"
+
+
+# Allowed characters map to themselves, spaces to underscores; one table
+# lookup per character instead of a regex pass.
+_TABLE = _CleanTable({ord(c): c for c in string.ascii_letters + string.digits + "_.-"})
+_TABLE[ord(" ")] = "_"
+
+
+@lru_cache(maxsize=4096)
+def name_clean(name: str) -> str:
+    new_name = name.translate(_TABLE)
+    if new_name.lower() == "plugins":
+        return f"{new_name}-user"
+    return new_name
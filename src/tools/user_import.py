@@ -1,6 +1,6 @@
-import json
-import random
-import string
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
@@ -14,20 +14,106 @@ from pyforgejo.api.user import user_get, user_list_keys
 from pyforgejo.models.create_key_option import CreateKeyOption
 from pyforgejo.models.create_user_option import CreateUserOption
 
+from . import fast_json, migration_state
 from .fg_migration import fg_print
 
+# Users verified or created during this run: the same author/assignee comes up
+# dozens of times across issues, and each miss costs a GET (plus a possible
+# create) against Forgejo.
+_user_cache: Dict[str, Dict] = {}
+
+def preload_forgejo_users(fg_http) -> int:
+    """Page /admin/users once and seed the user cache.
+
+    Migrations touch the same endpoint once per distinct author, assignee
+    and member; with the directory preloaded, ensure_user_exists resolves
+    every already-existing user locally and only unknown users cost HTTP.
+    Returns the number of users loaded (0 if the listing failed).
+    """
+    loaded = 0
+    page = 1
+    state = migration_state.get_state()
+    while True:
+        resp = fg_http.get("/admin/users", params={"limit": 50, "page": page}, timeout=30)
+        if not resp.ok:
+            fg_print.error(
+                f"Failed to preload Forgejo users (page {page}): {resp.status_code}",
+                "failed to preload forgejo users",
+            )
+            break
+        users = fast_json.loads(resp.content)
+        if not users:
+            break
+        logins = []
+        for user_obj in users:
+            login = (user_obj.get("login") or "").strip()
+            if not login:
+                continue
+            _user_cache[login] = user_obj
+            logins.append(login)
+            loaded += 1
+        # One committed transaction per page, not per user.
+        state.add_users(logins)
+        page += 1
+    return loaded
+
+
+# Email index over the whole GitLab user directory, built from one paginated
+# listing the first time an email is needed. Walking N/100 pages once beats
+# one users.get per distinct member; entries the listing did not expose an
+# email for still fall back to the per-user lookup below.
+_gitlab_email_by_id: Optional[Dict[int, str]] = None
+_gitlab_email_by_username: Optional[Dict[str, str]] = None
+# The first email lookup typically happens inside a thread pool; without a
+# lock every worker would see the index as unbuilt and walk the directory.
+_gitlab_email_lock = threading.Lock()
+
+
+def _email_of(u) -> Optional[str]:
+    for attr in ("email", "public_email"):
+        v = getattr(u, attr, None)
+        if isinstance(v, str) and v.strip():
+            return v.strip()
+    return None
+
+
+def _gitlab_email_index(gitlab_api: gitlab.Gitlab) -> Tuple[Dict[int, str], Dict[str, str]]:
+    global _gitlab_email_by_id, _gitlab_email_by_username
+    if _gitlab_email_by_id is None:
+        with _gitlab_email_lock:
+            if _gitlab_email_by_id is None:
+                by_id: Dict[int, str] = {}
+                by_username: Dict[str, str] = {}
+                try:
+                    for u in gitlab_api.users.list(iterator=True, per_page=100):
+                        email = _email_of(u)
+                        if not email:
+                            continue
+                        uid = getattr(u, "id", None)
+                        if isinstance(uid, int):
+                            by_id[uid] = email
+                        uname = (getattr(u, "username", "") or "").strip()
+                        if uname:
+                            by_username[uname.lower()] = email
+                except Exception as e:
+                    fg_print.warning(f"Could not build GitLab email index, falling back to per-user lookups: {e}")
+                _gitlab_email_by_id, _gitlab_email_by_username = by_id, by_username
+    return _gitlab_email_by_id, _gitlab_email_by_username
+
+
 @lru_cache(maxsize=10000)
 def gitlab_email_for_user_id(gitlab_api: gitlab.Gitlab, user_id: int) -> Optional[str]:
+    by_id, _ = _gitlab_email_index(gitlab_api)
+    email = by_id.get(user_id)
+    if email:
+        return email
+
     try:
         u = gitlab_api.users.get(user_id)
     except Exception:
         return None
 
-    for attr in ("email", "public_email"):
-        v = getattr(u, attr, None)
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-    return None
+    return _email_of(u)
 
 
 @lru_cache(maxsize=10000)
@@ -36,6 +122,11 @@ def gitlab_email_for_username(gitlab_api: gitlab.Gitlab, username: str) -> Optio
     if not username:
         return None
 
+    _, by_username = _gitlab_email_index(gitlab_api)
+    email = by_username.get(username.lower())
+    if email:
+        return email
+
     try:
         users = gitlab_api.users.list(username=username)
         if users:
@@ -60,7 +151,7 @@ def gitlab_email_for_username(gitlab_api: gitlab.Gitlab, username: str) -> Optio
 def get_user_keys(fg_client: AuthenticatedClient, username: str) -> List[Dict]:
     key_response: requests.Response = user_list_keys.sync_detailed(username, client=fg_client)
     if key_response.status_code.name == "OK":
-        return json.loads(key_response.content)
+        return fast_json.loads(key_response.content)
     status_code = key_response.status_code.name
     fg_print.error(
         f"Failed to load user keys for user {username}! {status_code}",
@@ -70,21 +161,22 @@ def get_user_keys(fg_client: AuthenticatedClient, username: str) -> List[Dict]:
 
 
 def user_key_exists(fg_client: AuthenticatedClient, username: str, keyname: str) -> bool:
-    existing_keys = get_user_keys(fg_client, username)
-    if existing_keys:
-        existing_key = next((item for item in existing_keys if item.get("title") == keyname), None)
-        if existing_key is not None:
-            fg_print.warning(f"Public key {keyname} already exists for user {username}, skipping!")
-            return True
-        print(f"Public key {keyname} does not exist for user {username}, importing!")
-        return False
-    print(f"No public keys for user {username}, importing!")
+    existing_titles = {item.get("title") for item in get_user_keys(fg_client, username)}
+    return _key_exists_in(existing_titles, username, keyname)
+
+
+def _key_exists_in(existing_titles: set, username: str, keyname: str) -> bool:
+    if keyname in existing_titles:
+        fg_print.warning(f"Public key {keyname} already exists for user {username}, skipping!")
+        return True
+    print(f"Public key {keyname} does not exist for user {username}, importing!")
     return False
 
 
 def _mk_tmp_password() -> str:
-    rnd_str = "".join(random.choices(string.ascii_uppercase + string.digits, k=10))
-    return f"Tmp1!{rnd_str}"
+    # One os.urandom + base64 call; the prefix keeps Forgejo's complexity
+    # rules satisfied whatever the random part happens to contain.
+    return "Tmp1!" + secrets.token_urlsafe(10)
 
 
 def ensure_user_exists(
@@ -100,12 +192,27 @@ def ensure_user_exists(
     if not username:
         return None, None
 
+    cached = _user_cache.get(username)
+    if cached is not None:
+        return cached, None
+
+    # Persisted state from earlier runs: the user was already confirmed in
+    # Forgejo, so skip the GET. Callers only use the dict for its username
+    # and truthiness on this path.
+    if migration_state.get_state().has_user(username):
+        user_obj = {"username": username}
+        _user_cache[username] = user_obj
+        return user_obj, None
+
     resp = user_get.sync_detailed(username, client=fg_client)
     if resp.status_code.name == "OK":
         try:
-            return json.loads(resp.content), None
+            user_obj = fast_json.loads(resp.content)
         except Exception:
             return None, None
+        _user_cache[username] = user_obj
+        migration_state.get_state().add_user(username)
+        return user_obj, None
 
     tmp_password = _mk_tmp_password()
     tmp_email = (email or "").strip() or f"{username}@noemail-git.local"
@@ -125,20 +232,16 @@ def ensure_user_exists(
     if import_response.status_code.name == "CREATED":
         suffix = f" ({reason})" if reason else ""
         fg_print.info(f"User {username} created{suffix}, temporary password: {tmp_password}")
-        resp2 = user_get.sync_detailed(username, client=fg_client)
-        if resp2.status_code.name == "OK":
-            try:
-                return json.loads(resp2.content), tmp_password
-            except Exception:
-                return None, tmp_password
-        return None, tmp_password
-
-    msg = ""
-    try:
-        msg = json.loads(import_response.content).get("message") or ""
-    except Exception:
-        msg = import_response.text or ""
+        # The 201 body already carries the full user object; skip the re-GET.
+        try:
+            user_obj = fast_json.loads(import_response.content)
+        except Exception:
+            return None, tmp_password
+        _user_cache[username] = user_obj
+        migration_state.get_state().add_user(username)
+        return user_obj, tmp_password
 
+    msg = fast_json.error_message(import_response)
     fg_print.error(f"Failed to create user {username}: {msg}", f"failed to create user {username}")
     return None, None
 
@@ -159,29 +262,39 @@ def import_user_keys(
         keys: List[gitlab.v4.objects.UserKey],
         username: str,
 ) -> None:
-    for key in keys:
-        if not user_key_exists(fg_client, username, key.title):
-            import_response: requests.Response = admin_create_public_key.sync_detailed(
-                username=username,
-                body=CreateKeyOption(
-                    key=key.key,
-                    read_only=True,
-                    title=key.title,
-                ),
-                client=fg_client,
+    def _import_one_key(key: gitlab.v4.objects.UserKey) -> None:
+        import_response: requests.Response = admin_create_public_key.sync_detailed(
+            username=username,
+            body=CreateKeyOption(
+                key=key.key,
+                read_only=True,
+                title=key.title,
+            ),
+            client=fg_client,
+        )
+        if import_response.status_code.name == "CREATED":
+            fg_print.info(f"Public key {key.title} imported!")
+        else:
+            msg = fast_json.error_message(import_response)
+            fg_print.error(
+                f"Public key {key.title} import failed: {msg}",
+                f"failed to import key {key.title} for user {username}",
             )
-            if import_response.status_code.name == "CREATED":
-                fg_print.info(f"Public key {key.title} imported!")
-            else:
-                msg = ""
-                try:
-                    msg = json.loads(import_response.content).get("message") or ""
-                except Exception:
-                    msg = import_response.text or ""
-                fg_print.error(
-                    f"Public key {key.title} import failed: {msg}",
-                    f"failed to import key {key.title} for user {username}",
-                )
+
+    if not keys:
+        return
+
+    # List the user's keys once and dedupe locally; probing per key would
+    # re-download the same listing N times.
+    existing_titles = {item.get("title") for item in get_user_keys(fg_client, username)}
+    to_create = [key for key in keys if not _key_exists_in(existing_titles, username, key.title)]
+    if not to_create:
+        return
+
+    # Key imports are independent network calls; a small thread pool overlaps
+    # their round-trips (the workload is RTT-bound, not CPU-bound).
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(_import_one_key, to_create))
 
 
 def import_one_gitlab_user(
@@ -197,14 +310,19 @@ def import_one_gitlab_user(
 
     print(f"Importing user {username}...")
 
-    try:
-        user_full = gitlab_api.users.get(user.id)
-    except Exception as e:
-        fg_print.error(
-            f"Failed to fetch full user {username} ({getattr(user, 'id', None)}): {e}",
-            f"failed to fetch full user {username}",
-        )
-        user_full = user
+    # Admin listings already include the email, and the keys manager works on
+    # listing objects too - the detail GET is only worth a round-trip when
+    # the email is genuinely missing.
+    user_full = user
+    if not _email_of(user):
+        try:
+            user_full = gitlab_api.users.get(user.id)
+        except Exception as e:
+            fg_print.error(
+                f"Failed to fetch full user {username} ({getattr(user, 'id', None)}): {e}",
+                f"failed to fetch full user {username}",
+            )
+            user_full = user
 
     tmp_email = f"{username}@noemail-git.local"
     if hasattr(user_full, "email") and isinstance(getattr(user_full, "email"), str) and user_full.email.strip():